@@ -5,6 +5,7 @@ from utils.stock_data_downloader import StockDataDownloader
 from utils.chart_plotter import ChartPlotter
 from utils.technical_indicators import TechnicalIndicators
 from utils.stock_price_predictor import StockPricePredictor
+from utils.cross_asset_analyzer import CrossAssetAnalyzer
 
 # Set up the Streamlit page
 st.set_page_config(
@@ -178,6 +179,50 @@ with st.expander(f'{ticker.upper()} - Stock Closing Price and Indicators', expan
             st.warning("No data available for plotting.")
     else:
         st.warning("No data available.")
+# Expander for watchlist correlation, beta and relative strength
+with st.expander('Watchlist Correlation and Relative Strength', expanded=False):
+    watchlist = st.text_input('Watchlist (comma separated)', value=f'{ticker.upper()}, MSFT, GOOGL, AMZN, NVDA, SPY')
+    window = st.number_input('Rolling Window (trading days)', min_value=10, max_value=252, value=60)
+    lookback = st.number_input('Relative Strength Lookback (trading days)', min_value=5, max_value=252, value=63)
+
+    # Beta and relative strength are measured against SPY, so always download it and follow its trading days
+    watchlist_tickers = [symbol.strip().upper() for symbol in watchlist.split(',') if symbol.strip()]
+    if 'SPY' not in watchlist_tickers:
+        watchlist_tickers.append('SPY')
+
+    close_prices = data_downloader.download_close_prices(watchlist_tickers, start_date, end_date, benchmark='SPY')
+
+    if close_prices is not None and 'SPY' in close_prices.columns and len(close_prices.columns) > 1:
+        analyzer = CrossAssetAnalyzer(window=int(window))
+        plotter = ChartPlotter()
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            rolling = analyzer.rolling_correlation(close_prices)
+            if rolling is not None:
+                last_date, corr_data = list(rolling['correlation'].items())[-1]
+                corr_fig = plotter.plot_correlation_heatmap(
+                    corr_data, chart_title=f"{int(window)} Day Correlation as of {last_date:%Y-%m-%d}")
+                st.plotly_chart(corr_fig)
+            else:
+                st.warning("No watchlist data available.")
+
+        with col2:
+            rank_data = analyzer.relative_strength(close_prices, lookback=int(lookback))
+            if rank_data is not None and not rank_data.empty:
+                rank_fig = plotter.plot_relative_strength_heatmap(rank_data)
+                st.plotly_chart(rank_fig)
+
+        summary = analyzer.relative_strength_summary(close_prices, lookback=int(lookback))
+        if summary is not None:
+            st.dataframe(summary)
+        else:
+            st.warning(f"Not enough data for a {int(lookback)} day relative strength summary.")
+        st.markdown(body="Beta is measured against SPY over the rolling window. Relative strength compares each ticker's return over the lookback period with SPY: an RS Percentile of 1.0 and a Rank of 1 are the strongest.")
+    else:
+        st.warning("No watchlist data available.")
+
 st.markdown("<small><sub>*** Disclaimer *** This is for entertainment only, not financial advice. Use this at your own risk.</sub></small>", unsafe_allow_html=True)
 
 # Create an instance of StockPricePredictor
@@ -177,3 +177,62 @@ class ChartPlotter():
         except Exception as e:
             print(f"An error occurred while plotting Simple Moving Average 50 and 200 days: {e}")
             return None
+
+    def plot_correlation_heatmap(self, corr_data, chart_title="Rolling Correlation"):
+        """
+        Plot a correlation matrix as a heatmap using Plotly.
+
+        Parameters:
+        corr_data (DataFrame): Square correlation matrix with tickers as index and columns.
+
+        Returns:
+        Figure: A Plotly figure.
+        """
+        try:
+            fig = go.Figure(go.Heatmap(z=corr_data.values, x=list(corr_data.columns), y=list(corr_data.index),
+                                       zmin=-1, zmax=1, colorscale='RdBu', reversescale=True,
+                                       colorbar=dict(title='Correlation')))
+
+            # Keep the first ticker at the top left, like a printed matrix
+            fig.update_layout(
+                title_text=chart_title,
+                yaxis_autorange='reversed'
+            )
+
+            return fig  # Return the Plotly figure directly, without converting to a dictionary
+        except Exception as e:
+            print(f"An error occurred while plotting the correlation heatmap: {e}")
+            return None
+
+    def plot_relative_strength_heatmap(self, rank_data, chart_title="Relative Strength Percentile Last 90 Days"):
+        """
+        Plot relative strength percentiles over time as a heatmap using Plotly.
+
+        Parameters:
+        rank_data (DataFrame): Percentiles (1.0 is strongest) indexed by date, one column per ticker.
+
+        Returns:
+        Figure: A Plotly figure.
+        """
+        try:
+            # Calculate the date 90 days ago from the last date in your data
+            ninety_days_ago = rank_data.index.max() - timedelta(days=90)
+
+            # Filter rows for the last 90 days and put the strongest ticker on top
+            rank_data = rank_data[rank_data.index >= ninety_days_ago]
+            rank_data = rank_data[rank_data.iloc[-1].sort_values(ascending=False).index]
+
+            fig = go.Figure(go.Heatmap(z=rank_data.T.values, x=rank_data.index, y=list(rank_data.columns),
+                                       zmin=0, zmax=1, colorscale='Viridis',
+                                       colorbar=dict(title='RS Percentile')))
+
+            fig.update_layout(
+                title_text=chart_title,
+                xaxis_title='Date',
+                yaxis_autorange='reversed'
+            )
+
+            return fig  # Return the Plotly figure directly, without converting to a dictionary
+        except Exception as e:
+            print(f"An error occurred while plotting the relative strength heatmap: {e}")
+            return None
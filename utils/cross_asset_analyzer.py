@@ -0,0 +1,526 @@
+# cross_asset_analyzer.py
+import numpy as np
+import pandas as pd
+
+
+class CrossAssetAnalyzer:
+    def __init__(self, window=60, min_periods=None, benchmark='SPY'):
+        """
+        Rolling cross-asset statistics for a watchlist of tickers.
+
+        Parameters:
+        window (int): Number of daily returns in each rolling window (default: 60).
+        min_periods (int): Minimum number of overlapping returns a pair needs to get a value (default: window).
+        benchmark (str): Ticker used for beta and relative strength (default: 'SPY').
+        """
+        self.window = window
+        self.min_periods = window if min_periods is None else min_periods
+        self.benchmark = benchmark
+
+    def calculate_returns(self, prices):
+        """
+        Calculate simple daily returns from an aligned close-price panel.
+
+        Every ticker should trade on the panel's dates, e.g. the benchmark's calendar from
+        StockDataDownloader.download_close_prices. A date only some tickers trade on leaves the
+        others without a return for that day and the next.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker.
+
+        Returns:
+        DataFrame: Daily returns indexed by date. The first date has no return, so there is one row fewer than prices.
+        """
+        return prices.sort_index().pct_change(fill_method=None).iloc[1:]
+
+    def _center_returns(self, values, valid):
+        """
+        Shift every column by its mean so the running sums stay small and the
+        covariance does not lose precision to cancellation.
+
+        Parameters:
+        values (ndarray): Daily returns, one column per ticker.
+        valid (ndarray): Boolean mask of the returns to use.
+
+        Returns:
+        ndarray: Centered returns with the unused entries set to zero.
+        """
+        # Columns without any valid return keep a zero center instead of a NaN mean
+        count = valid.sum(axis=0)
+        total = np.where(valid, values, 0.0).sum(axis=0)
+        center = total / np.maximum(count, 1)
+        return np.where(valid, values - center, 0.0)
+
+    def _window_products(self, pairs):
+        """
+        Keep the window sums of left.T @ right for each (left, right) pair of row-aligned arrays.
+
+        The sums are only brought up to date when they are asked for, by adding the days that
+        entered and removing the days that left since the last request as one block update.
+        They only move forward: asking for a window before the last one requested raises ValueError.
+
+        Parameters:
+        pairs (list): (left, right) arrays with one row per day.
+
+        Returns:
+        function: Takes the index of the last day of a window and returns the list of sums, which
+        are updated in place by later calls.
+        """
+        window = self.window
+        sums = [np.zeros((left.shape[1], right.shape[1])) for left, right in pairs]
+        steps = [np.empty_like(total) for total in sums]
+        synced = [None]
+
+        def sync(end):
+            last = synced[0]
+            if last is not None and end < last:
+                raise ValueError("Window sums were requested for a window that has already been passed")
+            if last is None or 2 * (end - last) >= window:
+                # Rebuilding from the window is cheaper than replaying this many days
+                rows = slice(end - window + 1, end + 1)
+                for (left, right), total in zip(pairs, sums):
+                    np.matmul(left[rows].T, right[rows], out=total)
+            elif end > last:
+                # Add the days that entered and drop the days that left since the last sync
+                rows = np.r_[last + 1:end + 1, last + 1 - window:end + 1 - window]
+                sign = np.repeat([1.0, -1.0], end - last)[:, None]
+                for (left, right), total, step in zip(pairs, sums, steps):
+                    np.matmul(left[rows].T, sign * right[rows], out=step)
+                    total += step
+            synced[0] = end
+            return sums
+
+        return sync
+
+    def _window_covariance(self, x):
+        """
+        Keep the N x N covariance of the returns over every day of the window.
+
+        Like _window_products, the matrix is only brought up to date when it is asked for. The
+        days that entered and left and the change of the column sums are applied as one low-rank
+        update, so moving on by a day is a single pass over the matrix.
+
+        Parameters:
+        x (ndarray): Centered daily returns with missing returns set to zero, one column per ticker.
+
+        Returns:
+        function: Takes the index of the last day of a window and returns the covariance, which is
+        updated in place by later calls.
+        """
+        window = self.window
+        cov = np.zeros((x.shape[1], x.shape[1]))
+        step = np.empty_like(cov)
+        synced = [None, None]
+
+        def sync(end):
+            last, last_sum = synced
+            if last is not None and end < last:
+                raise ValueError("The covariance was requested for a window that has already been passed")
+            rows = slice(end - window + 1, end + 1)
+            col_sum = x[rows].sum(axis=0)
+            if last is None or 2 * (end - last) + 2 >= window:
+                # Rebuilding from the window is cheaper than replaying this many days
+                np.matmul(x[rows].T, x[rows], out=cov)
+                np.subtract(cov, np.multiply.outer(col_sum, col_sum / window), out=cov)
+                np.divide(cov, window - 1, out=cov)
+            elif end > last:
+                # (sum of x_i * x_j - sum_i * sum_j / n) / (n - 1) moves by the days that entered,
+                # minus the days that left, minus the change of the column sum products
+                days = np.r_[last + 1:end + 1, last + 1 - window:end + 1 - window]
+                sign = np.repeat([1.0, -1.0], end - last)[:, None]
+                left = np.vstack([x[days], col_sum, last_sum])
+                right = np.vstack([sign * x[days], -col_sum / window, last_sum / window]) / (window - 1)
+                np.matmul(left.T, right, out=step)
+                np.add(cov, step, out=cov)
+            synced[:] = [end, col_sum]
+            return cov
+
+        return sync
+
+    def _iter_windows(self, prices):
+        """
+        Walk the panel one day at a time and yield the running moments of each window.
+
+        Per-ticker sums are updated as each day enters and the oldest day leaves, and so are the
+        sums of every ticker over the days each gappy ticker (one that misses some returns in the
+        panel) has no return. Sums of products of two tickers are kept by _window_products and
+        only synced when they are asked for, so a full pass holds a single set of them in memory.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker.
+
+        Yields:
+        Tuple: The window end date, the centered returns of the window, per-ticker return counts, sums and
+        sums of squares, a function taking ticker indices that returns their overlap sums with every ticker
+        (counts, sum of x_i, sum of x_j, sum of x_i^2, sum of x_j^2 and sum of x_i * x_j over the days where
+        both i and j have a return), and a function returning the N x N covariance over every day of the window,
+        which is only right for pairs of tickers that both have a full window.
+        """
+        returns = self.calculate_returns(prices)
+        values = returns.to_numpy(dtype=np.float64)
+        valid = np.isfinite(values)
+
+        x = self._center_returns(values, valid)
+        mask = valid.astype(np.float64)
+        x_sq = x * x
+
+        window = self.window
+        if len(x) < window:
+            return
+
+        n_tickers = x.shape[1]
+        col_count = mask[:window].sum(axis=0)
+        col_sum = x[:window].sum(axis=0)
+        col_sq = x_sq[:window].sum(axis=0)
+
+        pair_covariance = self._window_covariance(x)
+
+        # Only tickers with a missing return somewhere can ever have a partial window. Against a
+        # ticker that is never missing the overlap is the ticker's own window, and the other
+        # ticker's sums over the overlap are its window sums minus the days the ticker missed.
+        gappy = np.flatnonzero(~valid.all(axis=0))
+        position = np.full(n_tickers, -1)
+        position[gappy] = np.arange(gappy.size)
+        mask_g, x_g = mask[:, gappy], x[:, gappy]
+        missing_g = 1.0 - mask_g
+        x_both = np.hstack([x, x_sq])
+        missed = missing_g[:window].T @ x_both[:window]
+        product_sums = self._window_products([(x_g, x)])
+        inner_sums = self._window_products([(mask_g, mask_g), (x_g, mask_g), (x_g * x_g, mask_g)])
+        current = [None]
+
+        def overlap_sums(end, tickers):
+            if end != current[0]:
+                raise ValueError("Overlap sums are only available for the latest window")
+            rows = position[tickers]
+            sum_j = col_sum - missed[rows, :n_tickers]
+            sq_j = col_sq - missed[rows, n_tickers:]
+            own = [np.repeat(col[tickers, None], n_tickers, axis=1) for col in (col_count, col_sum, col_sq)]
+            for block, total in zip(own, inner_sums(end)):
+                block[:, gappy] = total[rows]
+            count, sum_i, sq_i = own
+            return count, sum_i, sum_j, sq_i, sq_j, product_sums(end)[0][rows]
+
+        dates = returns.index
+        for end in range(window - 1, len(x)):
+            if end >= window:
+                old = end - window
+                col_count += mask[end] - mask[old]
+                col_sum += x[end] - x[old]
+                col_sq += x_sq[end] - x_sq[old]
+                for day, sign in ((end, 1.0), (old, -1.0)):
+                    missed[np.flatnonzero(missing_g[day])] += sign * x_both[day]
+
+            current[0] = end
+            yield (dates[end], x[end - window + 1:end + 1], col_count, col_sum, col_sq,
+                   lambda tickers, end=end: overlap_sums(end, tickers),
+                   lambda end=end: pair_covariance(end))
+
+    def iter_rolling_matrices(self, prices):
+        """
+        Yield the rolling covariance and correlation matrices for every window.
+
+        Missing prices are handled pairwise, like pandas' DataFrame.cov and DataFrame.corr.
+        The same two arrays are filled for every window, so copy them to keep a window.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker.
+
+        Yields:
+        Tuple[Timestamp, ndarray, ndarray]: The window end date, covariance matrix and correlation matrix.
+        """
+        n_tickers = len(prices.columns)
+        out = (np.empty((n_tickers, n_tickers)), np.empty((n_tickers, n_tickers)))
+        for date, _, col_count, _, _, overlap_sums, pair_covariance in self._iter_windows(prices):
+            yield (date, *self._window_matrices(col_count, overlap_sums, pair_covariance, out))
+
+    def _window_matrices(self, col_count, overlap_sums, pair_covariance, out):
+        """
+        Fill the covariance and correlation matrices of a window.
+
+        Pairs of tickers that both have a full window of returns are read from the rolling
+        covariance, so they take a few in-place passes over the buffers. Only the rows and
+        columns of tickers missing some days are filled from their overlap sums.
+
+        Parameters:
+        col_count (ndarray): Number of returns of each ticker in the window.
+        overlap_sums (function): Returns the overlap sums of the given tickers with every ticker.
+        pair_covariance (function): Returns the N x N covariance over every day of the window.
+        out (Tuple[ndarray, ndarray]): N x N covariance and correlation arrays to fill.
+
+        Returns:
+        Tuple[ndarray, ndarray]: The filled covariance and correlation matrices.
+        """
+        cov, corr = out
+        n = self.window
+        if n < max(self.min_periods, 2):
+            cov.fill(np.nan)
+            corr.fill(np.nan)
+            return cov, corr
+
+        window_cov = pair_covariance()
+        var = np.diagonal(window_cov)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = 1.0 / np.sqrt(var)
+        scale[~(var > 0)] = np.nan
+        np.multiply(window_cov, scale, out=corr)
+        corr *= scale[:, None]
+        np.minimum(corr, 1.0, out=corr)
+        np.maximum(corr, -1.0, out=corr)
+        np.copyto(cov, window_cov)
+
+        partial = np.flatnonzero(col_count != n)
+        if partial.size:
+            partial_cov, partial_corr = self._pair_moments(*overlap_sums(partial))
+            cov[partial] = partial_cov
+            cov[:, partial] = partial_cov.T
+            corr[partial] = partial_corr
+            corr[:, partial] = partial_corr.T
+        return cov, corr
+
+    def _pair_moments(self, count, sum_i, sum_j, sq_i, sq_j, sum_xy):
+        """
+        Turn sums over the overlap of each (i, j) pair into covariances and correlations.
+
+        Parameters:
+        count (ndarray): Number of overlapping returns for each pair.
+        sum_i (ndarray): Sum of ticker i returns over the overlap.
+        sum_j (ndarray): Sum of ticker j returns over the overlap.
+        sq_i (ndarray): Sum of squared ticker i returns over the overlap.
+        sq_j (ndarray): Sum of squared ticker j returns over the overlap.
+        sum_xy (ndarray): Sum of return products over the overlap.
+
+        Returns:
+        Tuple[ndarray, ndarray]: The covariances and correlations, with the shape of count.
+        """
+        # Counts are whole numbers, round away any floating point drift
+        n = np.rint(count)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Centered sums of squares and products; the 1 / (n - 1) cancels out of the correlation
+            mean_i = sum_i / n
+            mean_j = sum_j / n
+            cov = sum_xy - sum_i * mean_j
+            var_ij = (sq_i - sum_i * mean_i) * (sq_j - sum_j * mean_j)
+            corr = cov / np.sqrt(var_ij)
+            cov /= n - 1
+
+        too_short = (n < max(self.min_periods, 2))
+        cov[too_short] = np.nan
+        corr[too_short | ~(var_ij > 0)] = np.nan
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return cov, corr
+
+    def _average_correlation(self, window_x, col_count, col_sum, col_sq, overlap_sums):
+        """
+        Calculate the mean pairwise correlation of a window without building the N x N matrix.
+
+        Pairs of tickers with a full window of returns are summed from the per-ticker sums
+        in O(N * window). Only the tickers missing some days in the window are compared
+        against every other ticker, from their rolling overlap sums in O(P * N) for P such tickers.
+
+        Returns:
+        float: Mean of the off-diagonal correlations that are defined.
+        """
+        n = self.window
+        if n < max(self.min_periods, 2):
+            return np.nan
+
+        full = col_count == n
+        partial = np.flatnonzero((col_count > 0) & ~full)
+
+        # Sum of cov_ij / (sd_i * sd_j) over the full tickers, diagonal included:
+        # the squared norm of the standardized daily portfolio minus its mean term
+        with np.errstate(divide='ignore', invalid='ignore'):
+            var = (col_sq - col_sum * col_sum / n) / (n - 1)
+        use = full & (var > 0)
+        k = use.sum()
+        scale = np.zeros_like(col_sum)
+        scale[use] = 1.0 / np.sqrt(var[use])
+        daily = window_x @ scale
+        total = (daily @ daily - (col_sum @ scale) ** 2 / n) / (n - 1)
+        corr_sum = total - k if k else 0.0
+        pair_count = k * (k - 1)
+
+        if partial.size:
+            # Sums over the overlap of each partial ticker i with every ticker j
+            _, corr = self._pair_moments(*overlap_sums(partial))
+            corr[np.arange(partial.size), partial] = np.nan
+
+            # Pairs of two partial tickers are already in the block twice, the others
+            # once, while the full matrix holds every pair twice
+            others = np.ones(len(col_count), dtype=bool)
+            others[partial] = False
+            both = corr[:, partial]
+            one = corr[:, others]
+            corr_sum += np.nansum(both) + 2 * np.nansum(one)
+            pair_count += np.isfinite(both).sum() + 2 * np.isfinite(one).sum()
+
+        return corr_sum / pair_count if pair_count else np.nan
+
+    def rolling_correlation(self, prices, sample_every=None, average_correlation=False):
+        """
+        Calculate rolling correlation and covariance matrices for a watchlist.
+
+        Only the sampled windows are kept, so memory stays bounded even for long histories.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker.
+        sample_every (int): Keep every n-th window in addition to the latest one (default: None, latest only).
+        average_correlation (bool): Also calculate the mean pairwise correlation of every window (default: False).
+
+        Returns:
+        dict: Maps 'correlation' and 'covariance' to {date: DataFrame}, and 'average_correlation' to a Series
+        with the mean pairwise correlation for every window (None unless requested). None if the panel is
+        shorter than the window.
+        """
+        try:
+            tickers = prices.columns
+            correlations, covariances = {}, {}
+            averages = {}
+            out = (np.empty((len(tickers), len(tickers))), np.empty((len(tickers), len(tickers))))
+            last = None
+
+            def keep(date, col_count, overlap_sums, pair_covariance):
+                cov, corr = self._window_matrices(col_count, overlap_sums, pair_covariance, out)
+                correlations[date] = pd.DataFrame(corr, index=tickers, columns=tickers, copy=True)
+                covariances[date] = pd.DataFrame(cov, index=tickers, columns=tickers, copy=True)
+
+            for step, moments in enumerate(self._iter_windows(prices)):
+                date, window_x, col_count, col_sum, col_sq, overlap_sums, pair_covariance = moments
+                if average_correlation:
+                    averages[date] = self._average_correlation(window_x, col_count, col_sum, col_sq, overlap_sums)
+                last = date
+
+                if sample_every and step % sample_every == 0:
+                    keep(date, col_count, overlap_sums, pair_covariance)
+
+            if last is None:
+                print(f"Not enough data to calculate a {self.window} day rolling correlation")
+                return None
+
+            if last not in correlations:
+                # The generator has finished on the latest window, so its moments are still current
+                keep(last, col_count, overlap_sums, pair_covariance)
+
+            return {
+                'correlation': correlations,
+                'covariance': covariances,
+                'average_correlation': (pd.Series(averages, name='Average Correlation', dtype=np.float64)
+                                        if average_correlation else None),
+            }
+
+        except Exception as e:
+            print(f"An error occurred while calculating rolling correlations: {e}")
+            return None
+
+    def rolling_beta(self, prices):
+        """
+        Calculate rolling beta of every ticker against the benchmark.
+
+        Uses cumulative sums of the return moments, so each window is an O(1) difference
+        per ticker. Each ticker's beta only uses the days where both it and the benchmark
+        have a return.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker, including the benchmark.
+
+        Returns:
+        DataFrame: Rolling beta indexed by date, one column per ticker.
+        """
+        try:
+            returns = self.calculate_returns(prices)
+            values = returns.to_numpy(dtype=np.float64)
+            bench = returns[self.benchmark].to_numpy(dtype=np.float64)[:, None]
+
+            valid = np.isfinite(values) & np.isfinite(bench)
+            x = self._center_returns(values, valid)
+            y = self._center_returns(np.broadcast_to(bench, values.shape), valid)
+
+            def window_sum(a):
+                # Rolling window sums from a cumulative sum with a leading row of zeros
+                cs = np.cumsum(a, axis=0)
+                cs = np.vstack([np.zeros((1, a.shape[1])), cs])
+                return cs[self.window:] - cs[:-self.window]
+
+            n = np.rint(window_sum(valid.astype(np.float64)))
+            sum_x = window_sum(x)
+            sum_y = window_sum(y)
+            sum_xy = window_sum(x * y)
+            sum_yy = window_sum(y * y)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                beta = (sum_xy - sum_x * sum_y / n) / (sum_yy - sum_y * sum_y / n)
+            beta[n < max(self.min_periods, 2)] = np.nan
+
+            return pd.DataFrame(beta, index=returns.index[self.window - 1:], columns=returns.columns)
+
+        except Exception as e:
+            print(f"An error occurred while calculating rolling beta: {e}")
+            return None
+
+    def relative_strength(self, prices, lookback=63):
+        """
+        Rank tickers by their return over a lookback period, relative to the benchmark.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker, including the benchmark.
+        lookback (int): Number of trading days in the return period (default: 63, about 3 months).
+
+        Returns:
+        DataFrame: Percentile (0 to 1, 1.0 is strongest) of each ticker's excess return for every date.
+        """
+        try:
+            period_returns = prices.sort_index().pct_change(periods=lookback, fill_method=None)
+            excess_returns = period_returns.sub(period_returns[self.benchmark], axis=0)
+            return excess_returns.rank(axis=1, pct=True).iloc[lookback:]
+
+        except Exception as e:
+            print(f"An error occurred while calculating relative strength: {e}")
+            return None
+
+    def relative_strength_summary(self, prices, lookback=63):
+        """
+        Summarize the latest return, excess return, beta and relative strength of each ticker.
+
+        'RS Percentile' uses the same scale as relative_strength (1.0 is strongest), while
+        'Rank' counts from 1 for the strongest ticker. 'Beta' is NaN when the history is
+        shorter than the rolling window.
+
+        Parameters:
+        prices (DataFrame): Close prices indexed by date, one column per ticker, including the benchmark.
+        lookback (int): Number of trading days in the return period (default: 63).
+
+        Returns:
+        DataFrame: One row per ticker, sorted from strongest to weakest, or None if there is no lookback return.
+        """
+        try:
+            prices = prices.sort_index()
+            if len(prices) <= lookback:
+                print(f"Not enough data to calculate a {lookback} day relative strength summary")
+                return None
+
+            period_return = prices.iloc[-1] / prices.iloc[-1 - lookback] - 1
+
+            # Histories shorter than the rolling window still get returns and ranks, just no beta
+            beta = self.rolling_beta(prices)
+            latest_beta = beta.iloc[-1] if beta is not None and not beta.empty else np.nan
+
+            summary = pd.DataFrame({
+                'Return': period_return,
+                'Excess Return': period_return - period_return[self.benchmark],
+                'Beta': latest_beta,
+            })
+            summary['RS Percentile'] = summary['Excess Return'].rank(pct=True)
+            summary['Rank'] = summary['Excess Return'].rank(ascending=False)
+            return summary.sort_values(by='Rank')
+
+        except Exception as e:
+            print(f"An error occurred while summarizing relative strength: {e}")
+            return None
+
+# Example usage
+# Assuming 'prices' is a close-price panel from StockDataDownloader.download_close_prices
+# analyzer = CrossAssetAnalyzer(window=60)
+# rolling = analyzer.rolling_correlation(prices)
+# beta = analyzer.rolling_beta(prices)
+# ranks = analyzer.relative_strength(prices)
@@ -142,6 +142,50 @@ class StockDataDownloader:
 
         return result
 
+    @st.cache_resource
+    def download_close_prices(_self, tickers, start_date=None, end_date=None, benchmark=None):
+        """Download daily closing prices for several tickers, aligned on a common date index.
+
+        Parameters:
+        tickers (list): The ticker symbols to download.
+        start_date (datetime): The start date of the date range for stock data (default: None).
+        end_date (datetime): The end date of the date range for stock data (default: None).
+        benchmark (str): Only keep the dates where this ticker has a close (default: None, every date any ticker traded).
+
+        Returns:
+        DataFrame: Closing prices indexed by date, one column per ticker, or None if nothing was found.
+        """
+        try:
+            tickers = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+            data = yf.download(tickers, start=start_date, end=end_date, group_by='column', progress=False)
+
+            if data.empty:
+                st.error(f"No data found for ticker symbols: {', '.join(tickers)}")
+                return None
+
+            prices = data['Close']
+            if not hasattr(prices, 'columns'):
+                prices = prices.to_frame(name=tickers[0])
+
+            # Tickers on other calendars (crypto, foreign listings) add dates where the rest have no
+            # close, which would turn their next daily return into NaN, so follow the benchmark's days
+            benchmark = benchmark.strip().upper() if benchmark else None
+            if benchmark in prices.columns:
+                prices = prices[prices[benchmark].notna()]
+
+            # Keep the requested order and drop tickers that returned no prices at all
+            prices = prices.reindex(columns=tickers).dropna(axis=1, how='all')
+            missing = [ticker for ticker in tickers if ticker not in prices.columns]
+            if missing:
+                st.warning(f"No data found for ticker symbols: {', '.join(missing)}")
+
+            prices.index.name = 'Date'
+            return prices.sort_index()
+
+        except Exception as e:
+            st.error(f"An error occurred while downloading closing prices: {e}")
+            return None
+
 # Usage example:
 # data_downloader = StockDataDownloader()
 # result = data_downloader.download_stock_info('AAPL', start_date=pd.to_datetime('2022-01-01'), end_date=pd.to_datetime('2022-12-31'))